@@ -1,7 +1,10 @@
 
+import os
 import numpy as np
 import math
+import json
 from collections import namedtuple
+from task_store import TaskStore, as_task_store
 
 # Definisi Tipe
 VM = namedtuple('VM', ['name', 'ip', 'cpu_cores', 'ram_gb'])
@@ -24,37 +27,49 @@ W_MAKESPAN = 1.0   # Fokus utama pada kecepatan
 W_STD_DEV = 1.7    # Penalti SANGAT TINGGI untuk ketidakseimbangan
 W_UTILIZATION = 1.2 # Penalti TINGGI untuk utilisasi yang rendah
 
+DEFAULT_ITERATIONS = 1000
+
+# Parameter yang bisa di-override per profil (lihat gsa_tuner.py)
+DEFAULT_PARAMS = {
+    'POP_SIZE': POP_SIZE,
+    'G0': G0,
+    'ALPHA': ALPHA,
+    'MUTATION_RATE': MUTATION_RATE,
+    'LOCAL_SEARCH_CANDIDATES': LOCAL_SEARCH_CANDIDATES,
+    'INERTIA_MAX': INERTIA_MAX,
+    'INERTIA_MIN': INERTIA_MIN,
+    'W_MAKESPAN': W_MAKESPAN,
+    'W_STD_DEV': W_STD_DEV,
+    'W_UTILIZATION': W_UTILIZATION,
+}
+DEFAULT_WEIGHTS = (W_MAKESPAN, W_STD_DEV, W_UTILIZATION)
+GSA_PROFILES_FILE = 'gsa_profiles.json'
+
 # --- Fungsi Fitness (Fungsi Biaya) yang Dioptimalkan ---
 
-def _get_vm_loads(solution: np.ndarray, tasks_dict: dict, vms_dict: dict, vm_map: list) -> np.ndarray:
+def _get_vm_loads(solution: np.ndarray, task_loads: np.ndarray, vm_cores: np.ndarray) -> np.ndarray:
     """Helper untuk menghitung total beban waktu eksekusi pada setiap VM."""
-    n_vms = len(vm_map)
-    vm_total_load_time = np.zeros(n_vms)
-    
-    for task_idx, vm_assigned_idx in enumerate(solution):
-        task = tasks_dict[task_idx]
-        vm_name = vm_map[int(vm_assigned_idx)]
-        vm = vms_dict[vm_name]
-        
-        exec_time = task.cpu_load / vm.cpu_cores
-        vm_total_load_time[int(vm_assigned_idx)] += exec_time
-    
-    return vm_total_load_time
+    n_vms = len(vm_cores)
+    # Jumlahkan cpu_load per VM sekaligus, lalu bagi dengan jumlah core VM
+    vm_total_cpu_load = np.bincount(solution, weights=task_loads, minlength=n_vms)
+    return vm_total_cpu_load / vm_cores
 
-def _evaluate_fitness(solution: np.ndarray, tasks_dict: dict, vms_dict: dict, vm_map: list) -> float:
+def _evaluate_fitness(solution: np.ndarray, task_loads: np.ndarray, vm_cores: np.ndarray,
+                      weights: tuple = DEFAULT_WEIGHTS) -> float:
     """
     [OPTIMASI #1] Fitness Function Terpadu: Makespan dengan Penalti untuk
     Imbalance dan Utilisasi Rendah.
     """
-    vm_loads = _get_vm_loads(solution, tasks_dict, vms_dict, vm_map)
-    n_vms = len(vm_map)
+    w_makespan, w_std_dev, w_utilization = weights
+    vm_loads = _get_vm_loads(solution, task_loads, vm_cores)
+    n_vms = len(vm_cores)
     
     # Komponen Utama: Makespan
     makespan = np.max(vm_loads)
     
     # Penalti 1: Ketidakseimbangan (Imbalance)
     load_std_dev = np.std(vm_loads)
-    imbalance_penalty = W_STD_DEV * load_std_dev
+    imbalance_penalty = w_std_dev * load_std_dev
     
     # Penalti 2: Utilisasi Rendah (Low Utilization)
     total_cpu_time = np.sum(vm_loads)
@@ -63,10 +78,10 @@ def _evaluate_fitness(solution: np.ndarray, tasks_dict: dict, vms_dict: dict, vm
     resource_utilization = total_cpu_time / (total_available_time + EPS)
     
     # Penalti adalah kebalikan dari utilisasi, diskalakan dengan makespan
-    utilization_penalty = W_UTILIZATION * (1.0 - resource_utilization) * makespan
+    utilization_penalty = w_utilization * (1.0 - resource_utilization) * makespan
     
     # Fitness Total
-    fitness_score = (W_MAKESPAN * makespan) + imbalance_penalty + utilization_penalty
+    fitness_score = (w_makespan * makespan) + imbalance_penalty + utilization_penalty
     
     return fitness_score
 
@@ -81,60 +96,105 @@ def _map_to_solution(position: np.ndarray, n_vms: int):
     return np.clip(np.round(position), 0, n_vms - 1).astype(int)
 
 # --- Mekanisme Local Search Cerdas ---
-def _intelligent_local_search(solution: np.ndarray, tasks_dict: dict, vms_dict: dict, vm_map: list) -> np.ndarray:
-    current_fitness = _evaluate_fitness(solution, tasks_dict, vms_dict, vm_map)
+def _intelligent_local_search(solution: np.ndarray, task_loads: np.ndarray, vm_cores: np.ndarray,
+                              weights: tuple = DEFAULT_WEIGHTS) -> np.ndarray:
+    current_fitness = _evaluate_fitness(solution, task_loads, vm_cores, weights)
     best_solution = solution.copy()
 
     for _ in range(2):
-        vm_loads = _get_vm_loads(best_solution, tasks_dict, vms_dict, vm_map)
+        vm_loads = _get_vm_loads(best_solution, task_loads, vm_cores)
         most_loaded_vm_idx, least_loaded_vm_idx = np.argmax(vm_loads), np.argmin(vm_loads)
         if most_loaded_vm_idx == least_loaded_vm_idx: break
-        tasks_on_most = [i for i, vm in enumerate(best_solution) if vm == most_loaded_vm_idx]
-        if not tasks_on_most: break
+        tasks_on_most = np.flatnonzero(best_solution == most_loaded_vm_idx)
+        if tasks_on_most.size == 0: break
         
         # Coba 'Move' tugas paling ringan dari VM tersibuk
-        task_loads = {i: tasks_dict[i].cpu_load for i in tasks_on_most}
-        task_to_move = min(task_loads, key=task_loads.get)
+        task_to_move = tasks_on_most[np.argmin(task_loads[tasks_on_most])]
         
         temp_solution = best_solution.copy()
         temp_solution[task_to_move] = least_loaded_vm_idx
-        new_fitness = _evaluate_fitness(temp_solution, tasks_dict, vms_dict, vm_map)
+        new_fitness = _evaluate_fitness(temp_solution, task_loads, vm_cores, weights)
         if new_fitness < current_fitness:
             current_fitness, best_solution = new_fitness, temp_solution
             
     return best_solution
 
 
-# --- Algoritma Utama CloudyGSA ---
+# --- Profil Parameter ---
+
+def resolve_params(params: dict = None) -> dict:
+    """Menggabungkan DEFAULT_PARAMS dengan override; kunci yang tidak dikenal ditolak."""
+    params = {key: value for key, value in (params or {}).items() if not key.startswith('_')}
+    unknown = set(params) - set(DEFAULT_PARAMS) - {'iterations'}
+    if unknown:
+        raise ValueError(f"Parameter Cloudy-GSA tidak dikenal: {', '.join(sorted(unknown))}")
+    resolved = {**DEFAULT_PARAMS, 'iterations': DEFAULT_ITERATIONS, **params}
+    resolved['POP_SIZE'] = int(resolved['POP_SIZE'])
+    resolved['LOCAL_SEARCH_CANDIDATES'] = int(resolved['LOCAL_SEARCH_CANDIDATES'])
+    resolved['iterations'] = int(resolved['iterations'])
+    return resolved
+
+def load_gsa_profile(name: str, path: str = GSA_PROFILES_FILE) -> dict:
+    """Memuat profil parameter hasil tuning (gsa_tuner.py) dari file JSON."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File profil Cloudy-GSA '{path}' tidak ditemukan (buat dengan gsa_tuner.py).")
+    with open(path, 'r', encoding='utf-8') as f:
+        profiles = json.load(f).get('profiles', {})
+    if name not in profiles:
+        raise ValueError(f"Profil Cloudy-GSA '{name}' tidak ada di '{path}'. Pilihan: {', '.join(profiles)}")
+    return resolve_params(profiles[name])
+
+def predicted_makespan(assignment: dict, tasks: list[Task] | TaskStore, vms: list[VM]) -> float:
+    """Makespan prediksi (cpu_load / core terbesar per VM) dari hasil penjadwalan."""
+    store = as_task_store(tasks)
+    vm_index = {vm.name: i for i, vm in enumerate(vms)}
+    solution = np.array([vm_index[assignment[task_id]] for task_id in store.ids.tolist()], dtype=int)
+    vm_cores = np.array([vm.cpu_cores for vm in vms], dtype=float)
+    return float(np.max(_get_vm_loads(solution, np.asarray(store.cpu_loads, dtype=float), vm_cores)))
 
-def cloudy_gsa_scheduler(tasks: list[Task], vms: list[VM], iterations: int = 1000) -> dict:
-    print(f"Memulai Cloudy-GSA (V4 - Unified Fitness, Adaptive Inertia, {iterations} iterasi)...")
+# --- Algoritma Utama CloudyGSA ---
 
-    n_tasks, n_vms = len(tasks), len(vms)
-    vms_dict = {vm.name: vm for vm in vms}; tasks_dict = {task.id: task for task in tasks}
+def cloudy_gsa_scheduler(tasks: list[Task] | TaskStore, vms: list[VM], iterations: int = None,
+                         params: dict = None, profile: str = None, verbose: bool = True) -> dict:
+    """
+    Parameter algoritma diambil dari `params` atau dari `profile` (gsa_profiles.json);
+    jika keduanya kosong dipakai konstanta modul. `iterations` eksplisit selalu diutamakan.
+    """
+    p = load_gsa_profile(profile) if profile else resolve_params(params)
+    iterations = iterations if iterations is not None else p['iterations']
+    pop_size, weights = p['POP_SIZE'], (p['W_MAKESPAN'], p['W_STD_DEV'], p['W_UTILIZATION'])
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    log(f"Memulai Cloudy-GSA (V4 - Unified Fitness, Adaptive Inertia, {iterations} iterasi)...")
+
+    store = as_task_store(tasks)
+    n_tasks, n_vms = len(store), len(vms)
+    # Posisi ke-i pada solusi = tugas ke-i pada store (tidak bergantung pada nilai id)
+    task_loads = np.asarray(store.cpu_loads, dtype=float)
+    vm_cores = np.array([vm.cpu_cores for vm in vms], dtype=float)
     vm_map = [vm.name for vm in vms]
 
-    pos = np.random.uniform(0, n_vms - 1, (POP_SIZE, n_tasks))
-    vel = np.zeros((POP_SIZE, n_tasks))
+    pos = np.random.uniform(0, n_vms - 1, (pop_size, n_tasks))
+    vel = np.zeros((pop_size, n_tasks))
 
-    fitness = np.array([_evaluate_fitness(_map_to_solution(p, n_vms), tasks_dict, vms_dict, vm_map) for p in pos])
+    fitness = np.array([_evaluate_fitness(_map_to_solution(x, n_vms), task_loads, vm_cores, weights) for x in pos])
 
     gbest_idx = np.argmin(fitness)
     gbest_val = fitness[gbest_idx]
     gbest_pos = pos[gbest_idx].copy()
     
-    print(f"Estimasi Fitness Awal (Acak): {gbest_val:.2f}")
+    log(f"Estimasi Fitness Awal (Acak): {gbest_val:.2f}")
 
-    inertia_weight = INERTIA_MAX
+    inertia_weight = p['INERTIA_MAX']
     stagnation_counter = 0
 
     for t in range(iterations):
-        G = G0 * math.exp(-ALPHA * (t / iterations))
+        G = p['G0'] * math.exp(-p['ALPHA'] * (t / iterations))
         mass = _compute_mass(fitness)
         
-        force = np.zeros((POP_SIZE, n_tasks))
-        for i in range(POP_SIZE):
-            for j in range(POP_SIZE):
+        force = np.zeros((pop_size, n_tasks))
+        for i in range(pop_size):
+            for j in range(pop_size):
                 if i != j:
                     diff = pos[j] - pos[i]
                     dist = np.linalg.norm(diff) + EPS
@@ -148,29 +208,29 @@ def cloudy_gsa_scheduler(tasks: list[Task], vms: list[VM], iterations: int = 100
 
         sorted_indices = np.argsort(fitness)
         for i, p_idx in enumerate(sorted_indices):
-            if i < LOCAL_SEARCH_CANDIDATES:
+            if i < p['LOCAL_SEARCH_CANDIDATES']:
                 current_solution = _map_to_solution(pos[p_idx], n_vms)
-                pos[p_idx] = _intelligent_local_search(current_solution, tasks_dict, vms_dict, vm_map).astype(float)
-            if np.random.rand() < MUTATION_RATE:
+                pos[p_idx] = _intelligent_local_search(current_solution, task_loads, vm_cores, weights).astype(float)
+            if np.random.rand() < p['MUTATION_RATE']:
                 task_to_mutate, new_vm = np.random.randint(n_tasks), np.random.randint(n_vms)
                 pos[p_idx, task_to_mutate] = new_vm
-            fitness[p_idx] = _evaluate_fitness(_map_to_solution(pos[p_idx], n_vms), tasks_dict, vms_dict, vm_map)
+            fitness[p_idx] = _evaluate_fitness(_map_to_solution(pos[p_idx], n_vms), task_loads, vm_cores, weights)
         
         current_best_idx = np.argmin(fitness)
         if fitness[current_best_idx] < gbest_val:
             gbest_val, gbest_pos = fitness[current_best_idx], pos[current_best_idx].copy()
             stagnation_counter = 0
             # [OPTIMASI #2] Inersia Adaptif: Sukses -> turunkan inersia (lebih presisi)
-            inertia_weight = max(INERTIA_MIN, inertia_weight - 0.05)
-            if t > 0 and t % 100 == 0: print(f"Iterasi {t}: Fitness Baru Terbaik: {gbest_val:.2f}")
+            inertia_weight = max(p['INERTIA_MIN'], inertia_weight - 0.05)
+            if t > 0 and t % 100 == 0: log(f"Iterasi {t}: Fitness Baru Terbaik: {gbest_val:.2f}")
         else:
             stagnation_counter += 1
             # [OPTIMASI #2] Inersia Adaptif: Stagnan -> naikkan inersia (eksplorasi)
-            if stagnation_counter > 20: inertia_weight = min(INERTIA_MAX, inertia_weight + 0.05)
+            if stagnation_counter > 20: inertia_weight = min(p['INERTIA_MAX'], inertia_weight + 0.05)
             pos[np.argmax(fitness)] = gbest_pos
 
-    print(f"Cloudy-GSA Selesai. Fitness Terbaik: {gbest_val:.2f}")
+    log(f"Cloudy-GSA Selesai. Fitness Terbaik: {gbest_val:.2f}")
 
     best_solution_discrete = _map_to_solution(gbest_pos, n_vms)
-    best_assignment = {task.id: vm_map[best_solution_discrete[i]] for i, task in enumerate(tasks)}
+    best_assignment = {task_id: vm_map[best_solution_discrete[i]] for i, task_id in enumerate(store.ids.tolist())}
     return best_assignment
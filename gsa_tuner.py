@@ -0,0 +1,217 @@
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cloudy_gsa_algorithm import GSA_PROFILES_FILE, cloudy_gsa_scheduler, predicted_makespan, resolve_params
+from scheduler import VM, VM_SPECS
+from task_store import load_task_store
+
+# --- Konfigurasi Tuning ---
+
+# Kelas workload -> file dataset
+WORKLOADS = {
+    'low_high': 'low_high.txt',
+    'random_simple': 'random_simple.txt',
+    'random_stratified': 'random_stratified.txt',
+}
+
+# Ruang pencarian: nama -> (jenis, batas bawah, batas atas)
+SEARCH_SPACE = {
+    'POP_SIZE': ('int', 10, 80),
+    'G0': ('float', 10.0, 200.0),
+    'ALPHA': ('float', 5.0, 40.0),
+    'MUTATION_RATE': ('float', 0.0, 0.1),
+    'LOCAL_SEARCH_CANDIDATES': ('int', 1, 10),
+    'INERTIA_MAX': ('float', 0.6, 1.0),
+    'INERTIA_MIN': ('float', 0.1, 0.6),
+    'W_MAKESPAN': ('float', 0.5, 2.0),
+    'W_STD_DEV': ('float', 0.0, 3.0),
+    'W_UTILIZATION': ('float', 0.0, 3.0),
+    'iterations': ('log_int', 20, 1000),
+}
+
+DEFAULT_TOLERANCE = 0.10  # Target = batas bawah makespan * (1 + toleransi)
+
+# Waktu planning diukur sebagai waktu CPU proses, bukan wall-clock, karena
+# kandidat dievaluasi bersamaan dan saling berebut CPU.
+TIMING_METHOD = 'process_time'
+
+# --- Sampling & Target ---
+
+def sample_params(rng: np.random.Generator, n_configs: int) -> list[dict]:
+    """Mengambil `n_configs` kombinasi parameter acak dari SEARCH_SPACE."""
+    configs = []
+    for _ in range(n_configs):
+        params = {}
+        for name, (kind, low, high) in SEARCH_SPACE.items():
+            if kind == 'int':
+                params[name] = int(rng.integers(low, high + 1))
+            elif kind == 'log_int':
+                params[name] = int(round(np.exp(rng.uniform(np.log(low), np.log(high)))))
+            else:
+                params[name] = round(float(rng.uniform(low, high)), 4)
+        configs.append(params)
+    return configs
+
+def makespan_lower_bound(dataset_path: str, vms: list[VM]) -> float:
+    """Batas bawah makespan: beban total dibagi total core, atau tugas terberat di VM terkuat."""
+    loads = load_task_store(dataset_path).cpu_loads
+    cores = [vm.cpu_cores for vm in vms]
+    if len(loads) == 0:
+        return 0.0
+    return max(float(loads.sum()) / sum(cores), float(loads.max()) / max(cores))
+
+def default_vms() -> list[VM]:
+    return [VM(name, None, spec['cpu'], spec['ram_gb']) for name, spec in VM_SPECS.items()]
+
+# --- Evaluasi (Worker) ---
+
+_STORE_CACHE = {}
+
+def _evaluate(params: dict, seed: int, dataset_path: str, vms: list[VM]) -> tuple:
+    """Worker: satu kali planning Cloudy-GSA, mengembalikan (makespan prediksi, detik CPU planning)."""
+    if dataset_path not in _STORE_CACHE:
+        _STORE_CACHE[dataset_path] = load_task_store(dataset_path)
+    tasks = _STORE_CACHE[dataset_path]
+
+    np.random.seed(seed)
+    start = time.process_time()
+    assignment = cloudy_gsa_scheduler(tasks, vms, params=params, verbose=False)
+    plan_seconds = time.process_time() - start
+    return predicted_makespan(assignment, tasks, vms), plan_seconds
+
+def _summarize(runs: list) -> dict:
+    makespans, seconds = zip(*runs)
+    return {
+        'mean_makespan': float(np.mean(makespans)),
+        'mean_plan_seconds': float(np.mean(seconds)),
+        'seeds': len(runs),
+    }
+
+def _rank_key(stats: dict, target: float) -> tuple:
+    """Yang mencapai target diurutkan berdasarkan waktu planning, sisanya berdasarkan makespan."""
+    reached = stats['mean_makespan'] <= target
+    return (not reached, stats['mean_plan_seconds'] if reached else stats['mean_makespan'])
+
+# --- Strategi Pencarian ---
+
+def tune(dataset_path: str, strategy: str = 'halving', n_configs: int = 27, eta: int = 3,
+         max_seeds: int = 9, target: float = None, tolerance: float = DEFAULT_TOLERANCE,
+         vms: list[VM] = None, max_workers: int = None, seed: int = 0) -> dict:
+    """
+    Mencari parameter Cloudy-GSA tercepat yang mencapai target makespan untuk satu dataset.
+    - 'random'  : semua kandidat dievaluasi dengan `max_seeds` seed.
+    - 'halving' : successive halving; tiap ronde hanya 1/eta kandidat terbaik yang lanjut
+                  dan jumlah seed dikali eta (sampai `max_seeds`).
+    """
+    if strategy not in ('random', 'halving'):
+        raise ValueError(f"Strategi '{strategy}' tidak dikenal. Pilihan: random, halving")
+
+    vms = vms or default_vms()
+    if target is None:
+        target = makespan_lower_bound(dataset_path, vms) * (1 + tolerance)
+
+    rng = np.random.default_rng(seed)
+    candidates = sample_params(rng, n_configs)
+    results = [[] for _ in candidates]   # (makespan, detik) per seed untuk tiap kandidat
+    alive = list(range(len(candidates)))
+    n_seeds = max_seeds if strategy == 'random' else 1
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            jobs = [(c, s) for c in alive for s in range(len(results[c]), n_seeds)]
+            outputs = executor.map(_evaluate, *zip(*[(candidates[c], seed + s, dataset_path, vms) for c, s in jobs]))
+            for (c, _), output in zip(jobs, outputs):
+                results[c].append(output)
+
+            stats = {c: _summarize(results[c]) for c in alive}
+            alive.sort(key=lambda c: _rank_key(stats[c], target))
+            best = stats[alive[0]]
+            print(f"  [{n_seeds} seed] {len(alive)} kandidat, terbaik: makespan {best['mean_makespan']:.2f} "
+                  f"(target {target:.2f}), planning {best['mean_plan_seconds']:.3f} detik CPU")
+
+            if strategy == 'random' or len(alive) == 1 or n_seeds >= max_seeds:
+                break
+            alive = alive[:max(1, len(alive) // eta)]
+            n_seeds = min(max_seeds, n_seeds * eta)
+
+    winner = alive[0]
+    return {
+        'params': resolve_params(candidates[winner]),
+        'target_makespan': target,
+        'reached_target': stats[winner]['mean_makespan'] <= target,
+        **stats[winner],
+    }
+
+# --- Penyimpanan Profil ---
+
+def save_profile(name: str, result: dict, dataset_path: str, strategy: str, path: str = GSA_PROFILES_FILE):
+    """Menyimpan/menimpa satu profil di file JSON yang dibaca `load_gsa_profile`."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    profiles = data.setdefault('profiles', {})
+    profiles[name] = {
+        **result['params'],
+        '_meta': {
+            'dataset': dataset_path,
+            'strategy': strategy,
+            'target_makespan': result['target_makespan'],
+            'reached_target': result['reached_target'],
+            'mean_makespan': result['mean_makespan'],
+            'mean_plan_seconds': result['mean_plan_seconds'],
+            'timing_method': TIMING_METHOD,
+            'seeds': result['seeds'],
+            'tuned_at': datetime.now().isoformat(timespec='seconds'),
+        },
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Autotuner parameter Cloudy-GSA per kelas workload.")
+    parser.add_argument('workloads', nargs='+', help=f"Kelas workload ({', '.join(WORKLOADS)}) atau path file dataset.")
+    parser.add_argument('--strategy', choices=['halving', 'random'], default='halving')
+    parser.add_argument('--configs', type=int, default=27, help="Jumlah kandidat parameter acak.")
+    parser.add_argument('--eta', type=int, default=3, help="Faktor eliminasi successive halving.")
+    parser.add_argument('--max-seeds', type=int, default=9, help="Jumlah seed maksimum per kandidat.")
+    parser.add_argument('--target', type=float, help="Target makespan prediksi (default: batas bawah * (1 + toleransi)).")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses paralel.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=GSA_PROFILES_FILE, help="File profil JSON.")
+    parser.add_argument('--profile-name', help="Nama profil (hanya untuk satu workload; default: nama workload).")
+    args = parser.parse_args(argv)
+
+    if args.profile_name and len(args.workloads) > 1:
+        parser.error("--profile-name hanya bisa dipakai dengan satu workload.")
+
+    for workload in args.workloads:
+        dataset_path = WORKLOADS.get(workload, workload)
+        if not os.path.exists(dataset_path):
+            print(f"Error: File dataset '{dataset_path}' tidak ditemukan.", file=sys.stderr)
+            sys.exit(1)
+        name = args.profile_name or os.path.splitext(os.path.basename(dataset_path))[0]
+
+        print(f"Tuning Cloudy-GSA untuk '{name}' ({args.strategy}, {args.configs} kandidat)...")
+        result = tune(dataset_path, args.strategy, args.configs, args.eta, args.max_seeds,
+                      args.target, args.tolerance, max_workers=args.workers, seed=args.seed)
+        save_profile(name, result, dataset_path, args.strategy, args.output)
+
+        status = "tercapai" if result['reached_target'] else "TIDAK tercapai"
+        print(f"Profil '{name}' disimpan ke '{args.output}' (target {status}): "
+              f"makespan {result['mean_makespan']:.2f}, planning {result['mean_plan_seconds']:.3f} detik CPU, "
+              f"{result['params']['iterations']} iterasi, populasi {result['params']['POP_SIZE']}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import os
+import re
+import sys
+import json
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from scheduler import ALGORITHMS
+
+# --- Konfigurasi ---
+
+CACHE_DIR = '.analytics_cache'
+MANIFEST_FILE = 'manifest.json'
+CACHE_VERSION = 3
+
+# Jumlah core per VM (disamakan dengan VM_SPECS di scheduler.py)
+VM_CORES = {'vm1': 1, 'vm2': 2, 'vm3': 4, 'vm4': 8}
+
+# Pola nama file hasil: <algoritma>_<dataset>_<run>.csv. Dataset bebas (mis. tasks_1m,
+# low_high_sweep2 dari mode sweep scheduler), run adalah angka terakhir sebelum .csv.
+RESULT_FILE_PATTERN = re.compile(
+    rf'^(?P<algorithm>{"|".join(map(re.escape, ALGORITHMS))})_(?P<dataset>.+?)_(?P<run>\d+)\.csv$'
+)
+# CSV yang bentuknya mirip file run tapi tidak cocok pola di atas -> diberi peringatan
+RUN_LIKE_PATTERN = re.compile(r'_\d+\.csv$')
+# Nama file lama (sebelum ada penamaan per dataset) -> (algoritma, dataset).
+# Dataset-nya diberi key sendiri agar tidak bertabrakan dengan <algoritma>_dataset_<run>.csv.
+LEGACY_FILE_PATTERNS = {
+    re.compile(r'^result_run_(?P<run>\d+)\.csv$'): ('cgsa', 'legacy_result_run'),
+    re.compile(r'^results_shc_(?P<run>\d+)\.csv$'): ('shc', 'legacy_results_shc'),
+}
+
+START_TIME_PERCENTILES = (50, 90, 99)
+NUMERIC_COLUMNS = ['start_time', 'exec_time', 'finish_time', 'wait_time']
+PARALLEL_THRESHOLD = 4  # Di bawah jumlah ini, proses serial lebih cepat dari spawn worker
+
+# --- Identifikasi File Hasil ---
+
+def parse_result_filename(filename: str):
+    """Mengembalikan (algoritma, dataset, run) dari nama file hasil, atau None."""
+    match = RESULT_FILE_PATTERN.match(filename)
+    if match:
+        return match['algorithm'], match['dataset'], int(match['run'])
+    for pattern, (algorithm, dataset) in LEGACY_FILE_PATTERNS.items():
+        match = pattern.match(filename)
+        if match:
+            return algorithm, dataset, int(match['run'])
+    return None
+
+def discover_result_files(results_dir: str) -> dict:
+    """
+    Mencari semua CSV hasil per-run di sebuah direktori.
+    Setiap (algoritma, dataset, run) hanya boleh dimiliki satu file; duplikat dilewati.
+    """
+    found, owners = {}, {}
+    for filename in sorted(os.listdir(results_dir)):
+        key = parse_result_filename(filename)
+        if key is None:
+            if RUN_LIKE_PATTERN.search(filename):
+                print(f"Peringatan: {filename} mirip file hasil run tapi nama algoritmanya tidak dikenal, dilewati.",
+                      file=sys.stderr)
+            continue
+        if key in owners:
+            print(f"Peringatan: {filename} dilewati, run {key} sudah dipakai oleh {owners[key]}.", file=sys.stderr)
+            continue
+        owners[key] = filename
+        found[filename] = key
+    return found
+
+# --- Perhitungan Metrik ---
+
+def compute_run_metrics(vm_assigned: np.ndarray, start_time: np.ndarray, exec_time: np.ndarray,
+                        finish_time: np.ndarray, wait_time: np.ndarray, vm_cores: dict = None) -> dict:
+    """
+    Menghitung metrik yang sama dengan `scheduler.calculate_metrics` dari kolom CSV.
+    Makespan diambil dari rentang waktu di CSV (start_time sudah relatif terhadap tugas pertama).
+    """
+    vm_cores = vm_cores or VM_CORES
+    if len(start_time) == 0:
+        return {}
+
+    makespan = float(np.max(finish_time) - np.min(start_time))
+
+    success = exec_time > 0
+    if not success.any():
+        return {}
+
+    num_tasks = int(success.sum())
+    ok_vm, ok_start = vm_assigned[success], start_time[success]
+    ok_exec, ok_wait = exec_time[success], wait_time[success]
+
+    total_cpu_time = float(ok_exec.sum())
+    throughput = num_tasks / makespan if makespan > 0 else 0
+
+    # Imbalance Degree (hanya VM yang menerima tugas, seperti groupby di scheduler)
+    vm_names, vm_idx = np.unique(ok_vm, return_inverse=True)
+    vm_exec_times = np.bincount(vm_idx, weights=ok_exec, minlength=len(vm_names))
+    avg_load = vm_exec_times.mean()
+    imbalance_degree = (vm_exec_times.max() - vm_exec_times.min()) / avg_load if avg_load > 0 else 0
+
+    total_cores = sum(vm_cores.values())
+    total_available_cpu_time = makespan * total_cores
+    resource_utilization = total_cpu_time / total_available_cpu_time if total_available_cpu_time > 0 else 0
+
+    metrics = {
+        "Makespan": makespan,
+        "Throughput": throughput,
+        "Total CPU Time": total_cpu_time,
+        "Total Wait Time": float(ok_wait.sum()),
+        "Avg Start Time": float(ok_start.mean()),
+        # Rata-rata semua baris termasuk tugas gagal (definisi lama di start_time.py)
+        "Avg Start Time (All Tasks)": float(start_time.mean()),
+        "Avg Execution Time": float(ok_exec.mean()),
+        "Avg Wait Time": float(ok_wait.mean()),
+        "Imbalance Degree": float(imbalance_degree),
+        "Resource Utilization": float(resource_utilization),
+    }
+    for q, value in zip(START_TIME_PERCENTILES, np.percentile(ok_start, START_TIME_PERCENTILES)):
+        metrics[f"Start Time P{q}"] = float(value)
+    return metrics
+
+# --- Cache Kolumnar Terpartisi ---
+
+def _partition_path(cache_dir: str, algorithm: str, dataset: str, run: int) -> str:
+    return os.path.join(cache_dir, f"algorithm={algorithm}", f"dataset={dataset}", f"run={run}.npz")
+
+def _ingest_file(source_path: str, partition_path: str, vm_cores: dict) -> tuple:
+    """
+    Worker: membaca satu CSV, menyimpannya sebagai kolom .npz, dan menghitung metrik.
+    Mengembalikan (metrik, pesan error); file yang tidak bisa dibaca tidak menghentikan refresh.
+    """
+    try:
+        df = pd.read_csv(source_path, usecols=['vm_assigned'] + NUMERIC_COLUMNS)
+    except (ValueError, OSError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        return {}, str(e)
+    columns = {col: df[col].to_numpy(dtype=float) for col in NUMERIC_COLUMNS}
+    columns['vm_assigned'] = df['vm_assigned'].to_numpy(dtype=str)
+
+    os.makedirs(os.path.dirname(partition_path), exist_ok=True)
+    np.savez(partition_path, **columns)
+    return compute_run_metrics(vm_cores=vm_cores, **columns), None
+
+def _load_manifest(cache_dir: str) -> dict:
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'version': CACHE_VERSION, 'files': {}}
+    if manifest.get('version') != CACHE_VERSION:
+        return {'version': CACHE_VERSION, 'files': {}}
+    return manifest
+
+def _save_manifest(cache_dir: str, manifest: dict):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, path)
+
+def refresh_cache(results_dir: str = '.', cache_dir: str = None, vm_cores: dict = None,
+                  max_workers: int = None) -> dict:
+    """
+    Menyinkronkan cache dengan CSV di `results_dir`.
+    Hanya file baru/berubah (berdasarkan mtime & ukuran) yang diproses ulang, secara paralel.
+    """
+    cache_dir = cache_dir or os.path.join(results_dir, CACHE_DIR)
+    vm_cores = vm_cores or VM_CORES
+    manifest = _load_manifest(cache_dir)
+    cached = manifest['files']
+
+    found = discover_result_files(results_dir)
+    pending = {}
+    for filename, (algorithm, dataset, run) in found.items():
+        stat = os.stat(os.path.join(results_dir, filename))
+        entry = cached.get(filename)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size \
+                and entry.get('vm_cores') == vm_cores:
+            continue
+        pending[filename] = {
+            'algorithm': algorithm, 'dataset': dataset, 'run': run,
+            'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'vm_cores': vm_cores,
+            'partition': _partition_path(cache_dir, algorithm, dataset, run),
+        }
+
+    # Hapus entri untuk file yang sudah tidak ada
+    removed = set(cached) - set(found)
+    for filename in removed:
+        partition = cached.pop(filename)['partition']
+        still_used = any(entry['partition'] == partition for entry in cached.values())
+        if os.path.exists(partition) and not still_used:
+            os.remove(partition)
+
+    if pending:
+        jobs = [(os.path.join(results_dir, name), entry['partition'], vm_cores) for name, entry in pending.items()]
+        if len(jobs) < PARALLEL_THRESHOLD or max_workers == 1:
+            results = [_ingest_file(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_ingest_file, *zip(*jobs)))
+        for (filename, entry), (metrics, error) in zip(pending.items(), results):
+            entry['metrics'] = metrics
+            entry['error'] = error
+            cached[filename] = entry
+            if error:
+                print(f"File {filename} tidak bisa dibaca, dilewati: {error}", file=sys.stderr)
+    if pending or removed:
+        _save_manifest(cache_dir, manifest)
+
+    print(f"Cache analitik: {len(found)} file hasil, {len(pending)} diproses ulang.")
+    return manifest
+
+def load_partition(manifest: dict, algorithm: str, dataset: str, run: int) -> dict:
+    """Memuat kolom mentah satu run dari cache (tanpa membaca CSV lagi)."""
+    for entry in manifest['files'].values():
+        if (entry['algorithm'], entry['dataset'], entry['run']) == (algorithm, dataset, run):
+            with np.load(entry['partition']) as data:
+                return {name: data[name] for name in data.files}
+    raise KeyError((algorithm, dataset, run))
+
+# --- Ringkasan & Perbandingan ---
+
+def run_metrics_frame(manifest: dict) -> pd.DataFrame:
+    """DataFrame metrik per-run dengan index (algorithm, dataset, run)."""
+    rows = []
+    for entry in manifest['files'].values():
+        if not entry.get('metrics'):
+            continue
+        rows.append({'algorithm': entry['algorithm'], 'dataset': entry['dataset'],
+                     'run': entry['run'], **entry['metrics']})
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).set_index(['algorithm', 'dataset', 'run']).sort_index()
+
+def compare_algorithms(run_metrics: pd.DataFrame) -> pd.DataFrame:
+    """Rata-rata metrik per (algorithm, dataset) beserta jumlah run."""
+    if run_metrics.empty:
+        return run_metrics
+    grouped = run_metrics.groupby(level=['algorithm', 'dataset'])
+    summary = grouped.mean()
+    summary.insert(0, 'Runs', grouped.size())
+    return summary
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Analitik hasil semua run dan algoritma.")
+    parser.add_argument('--results-dir', default='.', help="Direktori berisi CSV hasil per-run.")
+    parser.add_argument('--cache-dir', default=None, help=f"Direktori cache (default: <results-dir>/{CACHE_DIR}).")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses paralel untuk ingest.")
+    parser.add_argument('--output', default=None, help="Simpan perbandingan algoritma ke CSV ini.")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.results_dir):
+        print(f"Error: Direktori '{args.results_dir}' tidak ditemukan.", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = refresh_cache(args.results_dir, args.cache_dir, max_workers=args.workers)
+    summary = compare_algorithms(run_metrics_frame(manifest))
+    if summary.empty:
+        print("Tidak ada file hasil yang bisa dianalisis.")
+        return
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summary)
+    if args.output:
+        summary.to_csv(args.output)
+        print(f"\nPerbandingan algoritma disimpan ke '{args.output}'")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,10 @@
+from __future__ import annotations
+
 from collections import namedtuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from task_store import TaskStore
 
 # --- Definisi Tipe Data (Disamakan dengan main.py) ---
 VM = namedtuple('VM', ['name', 'ip', 'cpu_cores', 'ram_gb'])
@@ -19,29 +25,24 @@ def get_final_makespan(solution: dict, tasks_dict: dict, vms_dict: dict) -> floa
 
 # --- Algoritma Round Robin ---
 
-def round_robin_algorithm(tasks: list[Task], vms: list[VM]) -> dict:
+def round_robin_algorithm(tasks: list[Task] | TaskStore, vms: list[VM]) -> dict:
     """
     Algoritma Round Robin (RR).
     Membagi tugas secara berurutan (indeks % jumlah_vm).
+    Menerima list[Task] maupun TaskStore (array NumPy); list[Task] diproses tanpa numpy.
     """
     # print(f"Memulai Algoritma Round Robin untuk {len(tasks)} tugas...") # Opsional: dimatikan agar log main bersih
     
     # Setup mapping
-    vms_dict = {vm.name: vm for vm in vms}
-    tasks_dict = {task.id: task for task in tasks}
-    vm_names = list(vms_dict.keys())
+    task_ids = tasks.ids.tolist() if hasattr(tasks, 'ids') else [task.id for task in tasks]
+    vm_names = [vm.name for vm in vms]
     num_vms = len(vm_names)
 
-    # Dictionary untuk menyimpan hasil assignment
-    final_solution = {}
-
     # --- Logika Inti Round Robin ---
-    for i, task in enumerate(tasks):
-        # 0, 1, 2, 3 -> kembali ke 0, 1, ...
-        target_vm_index = i % num_vms
-        target_vm_name = vm_names[target_vm_index]
-        
-        # Tetapkan tugas ke VM tersebut
-        final_solution[task.id] = target_vm_name
+    # 0, 1, 2, 3 -> kembali ke 0, 1, ... (dihitung langsung dari posisi tugas)
+    final_solution = {
+        task_id: vm_names[i % num_vms]
+        for i, task_id in enumerate(task_ids)
+    }
     
-    return final_solution
\ No newline at end of file
+    return final_solution
@@ -1,26 +1,32 @@
-import asyncio
-import httpx
+from __future__ import annotations
+
 import time
 from datetime import datetime
 import csv
-import pandas as pd
 import sys
 import os
-from dotenv import load_dotenv
+import json
+import argparse
+import importlib
 from collections import namedtuple
-from cloudy_gsa_algorithm import cloudy_gsa_scheduler
-from rr_algo import round_robin_algorithm
-from shc_algo import stochastic_hill_climb
+from typing import TYPE_CHECKING
 
-# --- Konfigurasi Lingkungan ---
+if TYPE_CHECKING:
+    import asyncio
+    import httpx
+    from task_store import TaskStore
 
-load_dotenv()
+# Modul berat (asyncio, pandas, httpx, numpy, planner) di-import secara lazy di dalam
+# fungsi. Round Robin membaca dataset teks tanpa numpy (`load_tasks`), dan dry-run
+# berjalan sinkron tanpa asyncio/httpx/dotenv.
+
+# --- Konfigurasi Lingkungan ---
 
 VM_SPECS = {
-    'vm1': {'ip': os.getenv("VM1_IP"), 'cpu': 1, 'ram_gb': 1},
-    'vm2': {'ip': os.getenv("VM2_IP"), 'cpu': 2, 'ram_gb': 2},
-    'vm3': {'ip': os.getenv("VM3_IP"), 'cpu': 4, 'ram_gb': 4},
-    'vm4': {'ip': os.getenv("VM4_IP"), 'cpu': 8, 'ram_gb': 4},
+    'vm1': {'ip_env': "VM1_IP", 'cpu': 1, 'ram_gb': 1},
+    'vm2': {'ip_env': "VM2_IP", 'cpu': 2, 'ram_gb': 2},
+    'vm3': {'ip_env': "VM3_IP", 'cpu': 4, 'ram_gb': 4},
+    'vm4': {'ip_env': "VM4_IP", 'cpu': 8, 'ram_gb': 4},
 }
 
 VM_PORT = 5000
@@ -32,38 +38,162 @@ TOTAL_RUNS = 10  # Jumlah pengulangan test
 VM = namedtuple('VM', ['name', 'ip', 'cpu_cores', 'ram_gb'])
 Task = namedtuple('Task', ['id', 'name', 'index', 'cpu_load'])
 
+# --- Registry Algoritma & Profil Konfigurasi ---
+
+# nama -> (modul, fungsi); modul baru di-import saat algoritma benar-benar dipakai
+ALGORITHMS = {
+    'rr': ('rr_algo', 'round_robin_algorithm'),
+    'shc': ('shc_algo', 'stochastic_hill_climb'),
+    'cgsa': ('cloudy_gsa_algorithm', 'cloudy_gsa_scheduler'),
+}
+
+DEFAULT_CONFIG = {
+    'algorithm': 'cgsa',
+    'dataset': DATASET_FILE,
+    'iterations': GSA_ITERATIONS,
+    'runs': TOTAL_RUNS,
+    'run_delay': 2.0,         # Jeda antar run agar port benar-benar bersih
+    'results_prefix': None,   # Default: <algorithm>_<nama dataset>
+    'summary_file': None,     # Default: summary_metrics_<runs>_runs_<results_prefix>.csv
+    'dry_run': False,
+    'gsa_profile': None,      # Profil parameter Cloudy-GSA dari gsa_profiles.json (lihat gsa_tuner.py)
+}
+
+PROFILES = {
+    'default': {},
+    'dataset': {'dataset': 'dataset.txt'},
+    'low_high': {'dataset': 'low_high.txt'},
+    'random_simple': {'dataset': 'random_simple.txt'},
+    'random_stratified': {'dataset': 'random_stratified.txt'},
+    'smoke': {'runs': 1, 'iterations': 50, 'run_delay': 0.0},
+}
+
 # --- Fungsi Helper & Definisi Task ---
 
-def get_task_load(index: int):
-    cpu_load = (index * index * 10000)
-    return cpu_load
+def get_task_load(index: int) -> int:
+    return index * index * 10000
 
-def load_tasks(dataset_path: str) -> list[Task]:
+def load_tasks(dataset_path: str, rejected_counts: dict = None) -> list[Task]:
+    """
+    Memuat dataset teks sebagai list Task tanpa numpy (jalur ringan untuk Round Robin).
+    Aturan baris & id sama dengan `task_store.load_task_store`; jumlah baris yang
+    ditolak per alasan ditambahkan ke `rejected_counts` bila diberikan.
+    """
     if not os.path.exists(dataset_path):
-        print(f"Error: File dataset '{dataset_path}' tidak ditemukan.", file=sys.stderr)
-        sys.exit(1)
-        
+        raise FileNotFoundError(f"File dataset '{dataset_path}' tidak ditemukan.")
+
+    rejected_counts = rejected_counts if rejected_counts is not None else {}
     tasks = []
-    with open(dataset_path, 'r') as f:
+    with open(dataset_path, 'r', encoding='utf-8', errors='replace') as f:
         for i, line in enumerate(f):
             try:
                 index = int(line.strip())
-                if not 1 <= index <= 10:
-                    continue
-                
-                cpu_load = get_task_load(index)
-                task_name = f"task-{index}-{i}"
-                tasks.append(Task(
-                    id=i,
-                    name=task_name,
-                    index=index,
-                    cpu_load=cpu_load,
-                ))
             except ValueError:
-                pass
-    
+                rejected_counts['invalid'] = rejected_counts.get('invalid', 0) + 1
+                continue
+            if not 1 <= index <= 10:
+                rejected_counts['out_of_range'] = rejected_counts.get('out_of_range', 0) + 1
+                continue
+            tasks.append(Task(id=i, name=f"task-{index}-{i}", index=index, cpu_load=get_task_load(index)))
     return tasks
 
+def task_lookup(tasks):
+    """Fungsi id -> Task, baik untuk TaskStore maupun list[Task]."""
+    if hasattr(tasks, 'task_by_id'):
+        return tasks.task_by_id
+    return {task.id: task for task in tasks}.__getitem__
+
+def load_vms(read_env: bool = True) -> list[VM]:
+    """Membaca IP VM dari file .env; core & RAM diambil dari VM_SPECS. Tanpa .env (dry-run) IP = None."""
+    if read_env:
+        from dotenv import load_dotenv
+        load_dotenv()
+    return [VM(name, os.getenv(spec['ip_env']) if read_env else None, spec['cpu'], spec['ram_gb'])
+            for name, spec in VM_SPECS.items()]
+
+def get_planner(algorithm: str, gsa_profile: str = None):
+    """Mengembalikan fungsi planner(tasks, vms, iterations) untuk algoritma yang dipilih."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algoritma '{algorithm}' tidak dikenal. Pilihan: {', '.join(ALGORITHMS)}")
+    module_name, func_name = ALGORITHMS[algorithm]
+    planner = getattr(importlib.import_module(module_name), func_name)
+    if algorithm == 'rr':
+        return lambda tasks, vms, iterations: planner(tasks, vms)
+    if algorithm == 'cgsa' and gsa_profile:
+        return lambda tasks, vms, iterations: planner(tasks, vms, iterations=iterations, profile=gsa_profile)
+    return lambda tasks, vms, iterations: planner(tasks, vms, iterations=iterations)
+
+def resolve_config(profile: str = 'default', overrides: dict = None, profiles: dict = None,
+                   name_suffix: str = None) -> dict:
+    """
+    Menggabungkan DEFAULT_CONFIG <- profil <- override, lalu melengkapi nama file hasil.
+    `name_suffix` ditambahkan ke results_prefix default (dipakai sweep agar nama tidak bentrok).
+    """
+    profiles = profiles or PROFILES
+    if profile not in profiles:
+        raise ValueError(f"Profil '{profile}' tidak dikenal. Pilihan: {', '.join(profiles)}")
+
+    explicit = {**profiles[profile], **{key: value for key, value in (overrides or {}).items() if value is not None}}
+    config = {**DEFAULT_CONFIG, **explicit}
+    config['profile'] = profile
+
+    unknown = set(config) - set(DEFAULT_CONFIG) - {'profile'}
+    if unknown:
+        raise ValueError(f"Opsi konfigurasi tidak dikenal: {', '.join(sorted(unknown))}")
+    if config['algorithm'] not in ALGORITHMS:
+        raise ValueError(f"Algoritma '{config['algorithm']}' tidak dikenal. Pilihan: {', '.join(ALGORITHMS)}")
+
+    # Profil Cloudy-GSA hasil tuning membawa jumlah iterasinya sendiri
+    if config['algorithm'] == 'cgsa' and config['gsa_profile'] and 'iterations' not in explicit:
+        config['iterations'] = None
+
+    if not config['results_prefix']:
+        dataset_name = os.path.splitext(os.path.basename(config['dataset']))[0]
+        config['results_prefix'] = f"{config['algorithm']}_{dataset_name}"
+        if config['algorithm'] == 'cgsa' and config['gsa_profile']:
+            config['results_prefix'] += f"_gsa_{config['gsa_profile']}"
+        if name_suffix:
+            config['results_prefix'] += f"_{name_suffix}"
+    if not config['summary_file']:
+        config['summary_file'] = f"summary_metrics_{config['runs']}_runs_{config['results_prefix']}.csv"
+    return config
+
+def resolve_sweep(entries: list[dict], profile: str = 'default', overrides: dict = None,
+                  profiles: dict = None) -> list[dict]:
+    """
+    Menyusun konfigurasi sweep. Entri yang nama file hasil default-nya sama
+    (misalnya hanya beda iterations / gsa_profile) diberi akhiran _sweep<n>;
+    nama yang tetap bentrok (diisi eksplisit) ditolak.
+    """
+    overrides = overrides or {}
+    prepared = []
+    for entry in entries:
+        entry = dict(entry)
+        prepared.append((entry.pop('profile', profile), {**overrides, **entry}))
+
+    configs = [resolve_config(name, values, profiles) for name, values in prepared]
+    writers = [c for c in configs if not c['dry_run']]
+    prefix_counts = {}
+    for config in writers:
+        prefix_counts[config['results_prefix']] = prefix_counts.get(config['results_prefix'], 0) + 1
+
+    for n, (name, values) in enumerate(prepared, start=1):
+        if not configs[n - 1]['dry_run'] and prefix_counts[configs[n - 1]['results_prefix']] > 1:
+            configs[n - 1] = resolve_config(name, values, profiles, name_suffix=f"sweep{n}")
+
+    for key in ('results_prefix', 'summary_file'):
+        names = [c[key] for c in configs if not c['dry_run']]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Beberapa konfigurasi sweep menulis ke {key} yang sama: {', '.join(duplicates)}")
+    return configs
+
+def load_profiles(config_path: str) -> dict:
+    """Memuat profil tambahan dari file JSON: {"profiles": {"nama": {...}}}."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {**PROFILES, **data.get('profiles', {})}
+
 # --- Eksekutor Tugas Asinkron ---
 
 async def execute_task_on_vm(task: Task, vm: VM, client: httpx.AsyncClient, 
@@ -113,12 +243,12 @@ async def execute_task_on_vm(task: Task, vm: VM, client: httpx.AsyncClient,
 
 # --- Fungsi Paska-Proses & Metrik ---
 
-def write_results_to_csv(results_list: list, run_id: int):
+def write_results_to_csv(results_list: list, run_id: int, base_name: str = BASE_RESULTS_FILE):
     """Menyimpan hasil eksekusi ke file CSV dengan ID run tertentu."""
     if not results_list:
         return
 
-    filename = f"{BASE_RESULTS_FILE}_{run_id}.csv"
+    filename = f"{base_name}_{run_id}.csv"
     results_list.sort(key=lambda x: x['index'])
 
     headers = ["index", "task_name", "vm_assigned", "start_time", "exec_time", "finish_time", "wait_time"]
@@ -144,6 +274,8 @@ def calculate_metrics(results_list: list, vms: list[VM], total_schedule_time: fl
     Menghitung metrik dan mengembalikan dictionary berisi nilai-nilai metrik.
     Tidak lagi melakukan print (print dilakukan di main loop).
     """
+    import pandas as pd
+
     try:
         df = pd.DataFrame(results_list)
     except pd.errors.EmptyDataError:
@@ -198,24 +330,38 @@ def calculate_metrics(results_list: list, vms: list[VM], total_schedule_time: fl
 
 # --- Fungsi Eksekusi Satu Kali ---
 
-async def run_single_test(run_id: int, tasks: list[Task], vms: list[VM]) -> dict:
+def describe_plan(assignment: dict, tasks, vms: list[VM]) -> dict:
+    """Ringkasan rencana tanpa eksekusi: jumlah tugas & prediksi beban (cpu_load / core) per VM."""
+    plan = {vm.name: {'tasks': 0, 'predicted_load': 0.0} for vm in vms}
+    vms_dict = {vm.name: vm for vm in vms}
+    task_by_id = task_lookup(tasks)
+    for task_id, vm_name in assignment.items():
+        plan[vm_name]['tasks'] += 1
+        plan[vm_name]['predicted_load'] += task_by_id(task_id).cpu_load / vms_dict[vm_name].cpu_cores
+    return plan
+
+async def run_single_test(run_id: int, tasks: TaskStore | list[Task], vms: list[VM], config: dict = None) -> dict:
+    import asyncio
+    import httpx
+
+    config = config or resolve_config()
     print(f"\n--- Memulai Test Run ke-{run_id} ---")
     
-    tasks_dict = {task.id: task for task in tasks}
     vms_dict = {vm.name: vm for vm in vms}
 
-    # 2. Jalankan Algoritma Penjadwalan (CloudyGSA)
-    best_assignment = cloudy_gsa_scheduler(tasks, vms, iterations=GSA_ITERATIONS)
-    # best_assignment = round_robin
+    # 1. Jalankan Algoritma Penjadwalan (sesuai konfigurasi)
+    planner = get_planner(config['algorithm'], config['gsa_profile'])
+    best_assignment = planner(tasks, vms, config['iterations'])
     
     # 2. Siapkan Eksekusi
     results_list = []
     vm_semaphores = {vm.name: asyncio.Semaphore(vm.cpu_cores) for vm in vms}
     
+    task_by_id = task_lookup(tasks)
     async with httpx.AsyncClient() as client:
         all_task_coroutines = []
         for task_id, vm_name in best_assignment.items():
-            task = tasks_dict[task_id]
+            task = task_by_id(task_id)
             vm = vms_dict[vm_name]
             sem = vm_semaphores[vm_name]
             all_task_coroutines.append(
@@ -232,7 +378,7 @@ async def run_single_test(run_id: int, tasks: list[Task], vms: list[VM]) -> dict
         print(f"Run {run_id} selesai dalam {total_time:.4f} detik.")
 
     # 3. Simpan & Hitung
-    write_results_to_csv(results_list, run_id)
+    write_results_to_csv(results_list, run_id, config['results_prefix'])
     metrics = calculate_metrics(results_list, vms, total_time)
     
     # Tampilkan metrik singkat untuk run ini
@@ -241,37 +387,85 @@ async def run_single_test(run_id: int, tasks: list[Task], vms: list[VM]) -> dict
     
     return metrics
 
+def run_dry(tasks, vms: list[VM], config: dict):
+    """Hanya menjalankan planner dan mencetak rencana, tanpa request ke VM."""
+    planner = get_planner(config['algorithm'], config['gsa_profile'])
+    plan_start = time.monotonic()
+    assignment = planner(tasks, vms, config['iterations'])
+    plan_time = time.monotonic() - plan_start
+
+    print(f"[Dry-run] {config['algorithm']} pada '{config['dataset']}': {len(assignment)} tugas direncanakan dalam {plan_time:.4f} detik.")
+    plan = describe_plan(assignment, tasks, vms)
+    for vm_name, info in plan.items():
+        print(f"  {vm_name:<5}: {info['tasks']:>6} tugas, prediksi beban {info['predicted_load']:.2f}")
+    print(f"  Prediksi makespan: {max(info['predicted_load'] for info in plan.values()):.2f}")
+    return plan
+
+def _load_dataset(dataset_path: str, cache: dict, algorithm: str = None):
+    """
+    Memuat dataset sekali per proses (dipakai ulang antar konfigurasi sweep).
+    Round Robin dengan dataset teks memakai `load_tasks` (tanpa numpy); lainnya TaskStore.
+    """
+    light = algorithm == 'rr' and not dataset_path.endswith('.npy')
+    key = (dataset_path, light)
+    if key in cache:
+        return cache[key]
+
+    if light:
+        rejected_counts = {}
+        tasks = load_tasks(dataset_path, rejected_counts)
+        if rejected_counts:
+            print(f"Peringatan: {sum(rejected_counts.values())} baris dataset ditolak {rejected_counts}.",
+                  file=sys.stderr)
+    else:
+        from task_store import load_task_store
+        tasks = load_task_store(dataset_path)
+        if tasks.rejected:
+            print(f"Peringatan: {tasks.n_rejected} baris dataset ditolak {tasks.rejected_counts} "
+                  f"(contoh baris {tasks.rejected[0].line_no}: '{tasks.rejected[0].raw}', {tasks.rejected[0].reason}).",
+                  file=sys.stderr)
+    cache[key] = tasks
+    return tasks
+
 # --- Fungsi Main Utama ---
 
-async def main():
-    print(f"Mempersiapkan {TOTAL_RUNS} kali pengujian...")
-    
-    # Load Data
-    vms = [VM(name, spec['ip'], spec['cpu'], spec['ram_gb']) for name, spec in VM_SPECS.items()]
-    tasks = load_tasks(DATASET_FILE)
+async def run_config(config: dict, vms: list[VM], dataset_cache: dict = None) -> list[dict]:
+    """Menjalankan satu konfigurasi lengkap (semua run) dan menyimpan ringkasannya."""
+    import asyncio
+
+    dataset_cache = dataset_cache if dataset_cache is not None else {}
+    total_runs = config['runs']
+    tasks = _load_dataset(config['dataset'], dataset_cache, config['algorithm'])
     
-    if not tasks:
+    if not len(tasks):
         print("Tidak ada tugas. Keluar.")
-        return
+        return []
+
+    if config['dry_run']:
+        run_dry(tasks, vms, config)
+        return []
 
+    print(f"Mempersiapkan {total_runs} kali pengujian ({config['algorithm']}, '{config['dataset']}')...")
     all_run_metrics = []
 
     # Loop Eksekusi
-    for i in range(1, TOTAL_RUNS + 1):
-        metrics = await run_single_test(i, tasks, vms)
+    for i in range(1, total_runs + 1):
+        metrics = await run_single_test(i, tasks, vms, config)
         if metrics:
             all_run_metrics.append(metrics)
         
         # Optional: Jeda sedikit antar run agar port benar-benar bersih
-        if i < TOTAL_RUNS:
-            await asyncio.sleep(2)
+        if i < total_runs and config['run_delay'] > 0:
+            await asyncio.sleep(config['run_delay'])
 
     # Hitung Rata-rata
     print("\n" + "="*40)
-    print(f"HASIL AKHIR RATA-RATA DARI {TOTAL_RUNS} RUN")
+    print(f"HASIL AKHIR RATA-RATA DARI {total_runs} RUN")
     print("="*40)
 
     if all_run_metrics:
+        import pandas as pd
+
         df_metrics = pd.DataFrame(all_run_metrics)
         avg_metrics = df_metrics.mean()
         
@@ -288,11 +482,81 @@ async def main():
                 
         # Simpan Summary ke CSV
         df_metrics.loc['Average'] = avg_metrics
-        df_metrics.to_csv('summary_metrics_10_runs_cgsa_low_high.csv', index=True)
-        print(f"\nRingkasan metrik disimpan ke 'summary_metrics_10_runs.csv'")
+        df_metrics.to_csv(config['summary_file'], index=True)
+        print(f"\nRingkasan metrik disimpan ke '{config['summary_file']}'")
         
     else:
         print("Gagal mendapatkan metrik dari pengujian.")
 
+    return all_run_metrics
+
+def run_sweep(configs: list[dict]):
+    """
+    Menjalankan banyak konfigurasi dalam satu proses (modul & dataset tidak dimuat ulang).
+    Dry-run dijalankan sinkron; asyncio hanya dipakai untuk konfigurasi yang benar-benar dieksekusi.
+    """
+    vms = load_vms(read_env=not all(config['dry_run'] for config in configs))
+    dataset_cache = {}
+    for n, config in enumerate(configs, start=1):
+        if len(configs) > 1:
+            print(f"\n##### Konfigurasi {n}/{len(configs)}: {config['algorithm']} / {config['dataset']} #####")
+        if config['dry_run']:
+            tasks = _load_dataset(config['dataset'], dataset_cache, config['algorithm'])
+            if not len(tasks):
+                print("Tidak ada tugas. Keluar.")
+                continue
+            run_dry(tasks, vms, config)
+        else:
+            import asyncio
+            asyncio.run(run_config(config, vms, dataset_cache))
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Scheduler tugas ke VM (Round Robin, SHC, Cloudy-GSA).")
+    parser.add_argument('-a', '--algorithm', choices=sorted(ALGORITHMS), help="Algoritma penjadwalan.")
+    parser.add_argument('-p', '--profile', default='default', help="Nama profil konfigurasi.")
+    parser.add_argument('-c', '--config', help="File JSON berisi profil tambahan ({\"profiles\": {...}}).")
+    parser.add_argument('-d', '--dataset', help="File dataset teks (satu indeks tugas per baris) atau .npy dari task_store.py.")
+    parser.add_argument('-i', '--iterations', type=int, help="Jumlah iterasi untuk SHC / Cloudy-GSA.")
+    parser.add_argument('-r', '--runs', type=int, help="Jumlah pengulangan test.")
+    parser.add_argument('--run-delay', type=float, help="Jeda (detik) antar run.")
+    parser.add_argument('--results-prefix', help="Prefix file CSV hasil per-run.")
+    parser.add_argument('--summary-file', help="File CSV ringkasan metrik.")
+    parser.add_argument('--gsa-profile', help="Profil parameter Cloudy-GSA dari gsa_profiles.json.")
+    parser.add_argument('--dry-run', action='store_true', default=None, help="Hanya tampilkan rencana, tanpa eksekusi.")
+    parser.add_argument('--sweep', help="File JSON berisi list override konfigurasi untuk dijalankan berurutan.")
+    parser.add_argument('--list-profiles', action='store_true', help="Tampilkan profil yang tersedia lalu keluar.")
+    return parser
+
+def main(argv: list = None):
+    args = build_parser().parse_args(argv)
+
+    try:
+        profiles = load_profiles(args.config) if args.config else PROFILES
+        if args.list_profiles:
+            for name, values in profiles.items():
+                print(f"{name:<20} {json.dumps(values)}")
+            return
+
+        overrides = {
+            'algorithm': args.algorithm, 'dataset': args.dataset, 'iterations': args.iterations,
+            'runs': args.runs, 'run_delay': args.run_delay, 'results_prefix': args.results_prefix,
+            'summary_file': args.summary_file, 'dry_run': args.dry_run, 'gsa_profile': args.gsa_profile,
+        }
+        if args.sweep:
+            with open(args.sweep, 'r', encoding='utf-8') as f:
+                sweep_entries = json.load(f)
+            configs = resolve_sweep(sweep_entries, args.profile, overrides, profiles)
+        else:
+            configs = [resolve_config(args.profile, overrides, profiles)]
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        run_sweep(configs)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
@@ -1,31 +1,34 @@
 import random
 import copy
 from collections import namedtuple
+from task_store import TaskStore, as_task_store
 
 VM = namedtuple('VM', ['name', 'ip', 'cpu_cores', 'ram_gb'])
 Task = namedtuple('Task', ['id', 'name', 'index', 'cpu_load', 'ram_mb'])
 
 # --- Helper Function ---
-def get_initial_loads(solution: dict, tasks_dict: dict, vms_dict: dict) -> dict:
+def get_initial_loads(solution: dict, task_loads: dict, vms_dict: dict) -> dict:
     """Menghitung beban awal semua VM berdasarkan solusi saat ini."""
     vm_loads = {name: 0.0 for name in vms_dict}
     for task_id, vm_name in solution.items():
-        task = tasks_dict[task_id]
         vm = vms_dict[vm_name]
-        vm_loads[vm_name] += (task.cpu_load / vm.cpu_cores)
+        vm_loads[vm_name] += (task_loads[task_id] / vm.cpu_cores)
     return vm_loads
 
 # --- Algoritma Stochastic Hill Climbing dengan Restart ---
 
-def stochastic_hill_climb(tasks: list[Task], vms: list[VM], iterations: int = 1000, restarts: int = 5) -> dict:
+def stochastic_hill_climb(tasks: list[Task] | TaskStore, vms: list[VM], iterations: int = 1000, restarts: int = 5) -> dict:
     """
     SHC dengan Random Restart.
     Restarts berguna untuk mencegah algoritma terjebak di 'Local Optima'.
+    Menerima list[Task] maupun TaskStore; beban dibaca langsung dari array.
     """
     print(f"Memulai SHC ({iterations} iterasi per restart, {restarts} restarts)...")
     
     vms_dict = {vm.name: vm for vm in vms}
-    tasks_dict = {task.id: task for task in tasks}
+    store = as_task_store(tasks)
+    task_ids = store.ids.tolist()
+    task_loads = dict(zip(task_ids, store.cpu_loads.tolist()))
     vm_names = list(vms_dict.keys())
 
     # Variable untuk menyimpan solusi terbaik absolut dari semua restart
@@ -34,10 +37,10 @@ def stochastic_hill_climb(tasks: list[Task], vms: list[VM], iterations: int = 10
 
     for r in range(restarts):
         # 1. Inisialisasi Solusi Acak (Setiap restart mulai dari nol/random baru)
-        current_solution = {task.id: random.choice(vm_names) for task in tasks}
+        current_solution = {task_id: random.choice(vm_names) for task_id in task_ids}
         
         # Hitung beban awal (cukup sekali di awal loop)
-        current_vm_loads = get_initial_loads(current_solution, tasks_dict, vms_dict)
+        current_vm_loads = get_initial_loads(current_solution, task_loads, vms_dict)
         current_makespan = max(current_vm_loads.values()) # Cost Function
 
         # Simpan state lokal terbaik
@@ -50,11 +53,11 @@ def stochastic_hill_climb(tasks: list[Task], vms: list[VM], iterations: int = 10
             # Alih-alih copy dict penuh dan hitung ulang semua, kita simulasi saja.
             
             # A. Pilih tugas dan target VM baru
-            task_id_to_move = random.choice(list(tasks_dict.keys()))
+            task_id_to_move = random.choice(task_ids)
             current_vm_name = current_solution[task_id_to_move]
             new_vm_name = random.choice([v for v in vm_names if v != current_vm_name])
             
-            task = tasks_dict[task_id_to_move]
+            task_load = task_loads[task_id_to_move]
             
             # B. Hitung perubahan beban jika tugas dipindah
             # Load saat ini
@@ -62,8 +65,8 @@ def stochastic_hill_climb(tasks: list[Task], vms: list[VM], iterations: int = 10
             load_vm_new = current_vm_loads[new_vm_name]
             
             # Hitung load tugas
-            cost_on_old = task.cpu_load / vms_dict[current_vm_name].cpu_cores
-            cost_on_new = task.cpu_load / vms_dict[new_vm_name].cpu_cores
+            cost_on_old = task_load / vms_dict[current_vm_name].cpu_cores
+            cost_on_new = task_load / vms_dict[new_vm_name].cpu_cores
             
             # Prediksi load baru
             pred_load_vm_old = load_vm_old - cost_on_old
@@ -1,29 +1,34 @@
 import pandas as pd
+from results_analytics import refresh_cache, run_metrics_frame
 
-NUM_FILES = 10
+ALGORITHM = "shc"
+DATASET = "random_stratified"
 SUMMARY_CSV = "summary_avg_start_time.csv"
-summary_data = []
+# Rata-rata start_time semua baris (termasuk tugas gagal), sama seperti versi sebelumnya
+START_TIME_METRIC = "Avg Start Time (All Tasks)"
 
-for i in range(1, NUM_FILES + 1):
-    filename = f"shc_random_stratified_{i}.csv"
-    try:
-        df = pd.read_csv(filename)
-        if "start_time" not in df.columns:
-            print(f"File {filename} tidak punya kolom 'start_time', dilewati.")
-            continue
-        
-        avg_start_time = df["start_time"].mean()
-        summary_data.append({
-            "Percobaan Ke-": i,
-            "Average Start Time": avg_start_time
-        })
-        print(f"{filename}: Average Start Time = {avg_start_time:.4f}")
-    except FileNotFoundError:
-        print(f"File {filename} tidak ditemukan, dilewati.")
+def main():
+    # Semua CSV hasil dibaca sekali ke cache analitik; di sini cukup ambil metriknya
+    run_metrics = run_metrics_frame(refresh_cache("."))
+    summary_data = []
 
-# Buat DataFrame summary
-summary_df = pd.DataFrame(summary_data)
+    if not run_metrics.empty and (ALGORITHM, DATASET) in run_metrics.droplevel('run').index:
+        for run, row in run_metrics.loc[(ALGORITHM, DATASET)].iterrows():
+            avg_start_time = row[START_TIME_METRIC]
+            summary_data.append({
+                "Percobaan Ke-": run,
+                "Average Start Time": avg_start_time
+            })
+            print(f"{ALGORITHM}_{DATASET}_{run}.csv: Average Start Time = {avg_start_time:.4f}")
+    else:
+        print(f"Tidak ada file hasil untuk {ALGORITHM}_{DATASET}.")
 
-# Simpan ke CSV
-summary_df.to_csv(SUMMARY_CSV, index=False)
-print(f"\nSummary Average Start Time disimpan di '{SUMMARY_CSV}'")
+    # Buat DataFrame summary
+    summary_df = pd.DataFrame(summary_data)
+
+    # Simpan ke CSV
+    summary_df.to_csv(SUMMARY_CSV, index=False)
+    print(f"\nSummary Average Start Time disimpan di '{SUMMARY_CSV}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import os
+import sys
+import argparse
+import numpy as np
+from collections import namedtuple
+
+# Definisi Tipe (disamakan dengan scheduler.py)
+Task = namedtuple('Task', ['id', 'name', 'index', 'cpu_load'])
+RejectedLine = namedtuple('RejectedLine', ['line_no', 'raw', 'reason'])
+
+# --- Konstanta ---
+MIN_TASK_INDEX = 1
+MAX_TASK_INDEX = 10
+MAX_DIGITS = 18          # Batas aman sebelum overflow int64
+MAX_LINE_BYTES = 64      # Baris lebih panjang di-strip satu per satu sebelum masuk array
+MAX_REPORTED_BYTES = 80  # Potongan baris yang disimpan di laporan penolakan
+MAX_REJECTED_SAMPLES = 100  # Contoh baris ditolak yang disimpan; sisanya hanya dihitung
+DEFAULT_CHUNK_LINES = 1_000_000
+READ_BLOCK_BYTES = 1 << 20
+
+# Layout record untuk format biner (.npy) yang bisa di-memory-map
+TASK_RECORD_DTYPE = np.dtype([('id', '<i8'), ('index', '<i8'), ('cpu_load', '<i8')])
+
+# --- Fungsi Helper ---
+
+def get_task_load(index):
+    """Beban CPU tugas; menerima int maupun array NumPy."""
+    return index * index * 10000
+
+# --- Task Store Berbasis Array ---
+
+class TaskStore:
+    """
+    Kumpulan tugas dalam bentuk array NumPy kolumnar (id, index, cpu_load).
+    Planner bisa langsung memakai array-nya tanpa membuat namedtuple per tugas.
+    """
+
+    def __init__(self, ids: np.ndarray, indices: np.ndarray, cpu_loads: np.ndarray,
+                 rejected: list = None, rejected_counts: dict = None):
+        self.ids = ids
+        self.indices = indices
+        self.cpu_loads = cpu_loads
+        # Hanya MAX_REJECTED_SAMPLES contoh pertama; jumlah lengkap per alasan ada di rejected_counts
+        self.rejected = rejected if rejected is not None else []
+        self.rejected_counts = rejected_counts if rejected_counts is not None else {}
+        self._id_positions = None
+
+    @property
+    def n_rejected(self) -> int:
+        return sum(self.rejected_counts.values())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for pos in range(len(self)):
+            yield self.task(pos)
+
+    def task(self, pos: int) -> Task:
+        """Membuat satu Task berdasarkan posisi di dalam store."""
+        task_id, index = int(self.ids[pos]), int(self.indices[pos])
+        return Task(
+            id=task_id,
+            name=f"task-{index}-{task_id}",
+            index=index,
+            cpu_load=int(self.cpu_loads[pos]),
+        )
+
+    def task_by_id(self, task_id: int) -> Task:
+        """
+        Mencari Task berdasarkan id. Id dari loader terurut naik (nomor baris) sehingga
+        cukup searchsorted; store dari list[Task] yang tidak terurut memakai dict.
+        """
+        if self._id_positions is None:
+            ordered = len(self) < 2 or bool(np.all(np.diff(self.ids) > 0))
+            self._id_positions = False if ordered else {int(i): pos for pos, i in enumerate(self.ids)}
+        if self._id_positions:
+            return self.task(self._id_positions[task_id])
+
+        pos = int(np.searchsorted(self.ids, task_id))
+        if pos >= len(self) or self.ids[pos] != task_id:
+            raise KeyError(task_id)
+        return self.task(pos)
+
+    def to_tasks(self) -> list[Task]:
+        """Materialisasi ke list Task (hanya jika benar-benar dibutuhkan)."""
+        return list(self)
+
+    @classmethod
+    def from_tasks(cls, tasks: list) -> 'TaskStore':
+        return cls(
+            ids=np.fromiter((t.id for t in tasks), dtype=np.int64, count=len(tasks)),
+            indices=np.fromiter((t.index for t in tasks), dtype=np.int64, count=len(tasks)),
+            cpu_loads=np.fromiter((t.cpu_load for t in tasks), dtype=np.int64, count=len(tasks)),
+        )
+
+def as_task_store(tasks) -> TaskStore:
+    """Menerima TaskStore atau list[Task] dan selalu mengembalikan TaskStore."""
+    if isinstance(tasks, TaskStore):
+        return tasks
+    return TaskStore.from_tasks(tasks)
+
+# --- Loader Teks (Vektorisasi) ---
+
+def _parse_int(line: bytes):
+    """Fallback per-baris dengan aturan int() (mis. '1_0', angka non-ASCII, nol di depan)."""
+    try:
+        return int(line.decode('utf-8').strip())
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+def _parse_lines(lines: list[bytes], first_line_no: int) -> TaskStore:
+    """
+    Parsing sekumpulan baris sekaligus dengan operasi array NumPy.
+    Baris yang ditolak jalur vektor (jarang) dicoba lagi dengan int(), sehingga
+    aturan penerimaannya sama dengan `int(line.strip())` versi lama.
+    """
+    if not lines:
+        empty = np.empty(0, dtype=np.int64)
+        return TaskStore(empty, empty.copy(), empty.copy())
+
+    line_nos = np.arange(first_line_no, first_line_no + len(lines), dtype=np.int64)
+
+    # Array bytes NumPy selebar baris terpanjang, jadi baris yang terlalu panjang
+    # diganti baris kosong di salinan list (satu baris 100 KB bisa membuat array ratusan GB).
+    lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    long_positions = np.flatnonzero(lengths > MAX_LINE_BYTES)
+    short_lines = lines
+    if long_positions.size:
+        short_lines = list(lines)
+        for pos in long_positions:
+            short_lines[pos] = b''
+
+    raw = np.array(short_lines, dtype=bytes)
+    stripped = np.char.strip(raw)
+
+    # Jalur cepat: digit ASCII dengan maksimal satu tanda +/- di depan
+    digits = np.char.lstrip(stripped, b'+-')
+    n_digits = np.char.str_len(digits)
+    single_sign = (np.char.str_len(stripped) - n_digits) <= 1
+    numeric = single_sign & np.char.isdigit(digits) & (n_digits <= MAX_DIGITS)
+    numeric[long_positions] = False
+    values = np.zeros(len(lines), dtype=np.int64)
+    values[numeric] = digits[numeric].astype(np.int64)
+    negative = numeric & np.char.startswith(stripped, b'-')
+    values[negative] = -values[negative]
+
+    # Jalur lambat: hanya baris yang ditolak jalur cepat
+    reasons = {}
+    for pos in np.flatnonzero(~numeric):
+        value = _parse_int(lines[pos])
+        if value is None:
+            reasons[pos] = 'too_long' if lengths[pos] > MAX_LINE_BYTES else 'invalid'
+        elif MIN_TASK_INDEX <= value <= MAX_TASK_INDEX:
+            numeric[pos], values[pos] = True, value
+        else:
+            reasons[pos] = 'out_of_range'
+
+    in_range = numeric & (values >= MIN_TASK_INDEX) & (values <= MAX_TASK_INDEX)
+    out_of_range = numeric & ~in_range
+
+    rejected_counts = {}
+    for reason in ('invalid', 'too_long'):
+        count = sum(1 for r in reasons.values() if r == reason)
+        if count:
+            rejected_counts[reason] = count
+    n_out_of_range = int(out_of_range.sum()) + sum(1 for r in reasons.values() if r == 'out_of_range')
+    if n_out_of_range:
+        rejected_counts['out_of_range'] = n_out_of_range
+
+    rejected = []
+    for pos in np.flatnonzero(~in_range)[:MAX_REJECTED_SAMPLES]:
+        reason = reasons.get(pos, 'out_of_range')
+        line = lines[pos][:MAX_REPORTED_BYTES]
+        rejected.append(RejectedLine(int(line_nos[pos]), line.decode(errors='replace'), reason))
+
+    indices = values[in_range]
+    return TaskStore(
+        ids=line_nos[in_range],
+        indices=indices,
+        cpu_loads=get_task_load(indices),
+        rejected=rejected,
+        rejected_counts=rejected_counts,
+    )
+
+def _iter_lines(f, block_bytes: int = READ_BLOCK_BYTES):
+    """
+    Memecah file biner menjadi baris dengan aturan yang sama seperti bytes.splitlines()
+    (\n, \r\n, dan \r), tanpa membaca seluruh file sekaligus.
+    """
+    remainder = b''
+    while True:
+        block = f.read(block_bytes)
+        if not block:
+            break
+        lines = (remainder + block).splitlines(keepends=True)
+        # Baris terakhir bisa terpotong (atau '\r' yang diikuti '\n' di blok berikutnya)
+        remainder = lines.pop()
+        if remainder.endswith(b'\n'):
+            lines.append(remainder)
+            remainder = b''
+        for line in lines:
+            yield line.rstrip(b'\r\n')
+    if remainder:
+        yield remainder.rstrip(b'\r\n')
+
+def load_task_store(dataset_path: str) -> TaskStore:
+    """
+    Membaca file dataset (satu indeks per baris) ke TaskStore.
+    Baris diterima dengan aturan yang sama seperti `int(line.strip())`. Baris yang
+    tidak valid atau di luar rentang tidak dibuang diam-diam: jumlahnya per alasan
+    ada di `store.rejected_counts` dan contohnya di `store.rejected`.
+    File .npy dibaca sebagai format biner (lihat `load_task_store_binary`).
+    """
+    if not os.path.exists(dataset_path):
+        raise FileNotFoundError(f"File dataset '{dataset_path}' tidak ditemukan.")
+    if dataset_path.endswith('.npy'):
+        return load_task_store_binary(dataset_path)
+
+    with open(dataset_path, 'rb') as f:
+        lines = f.read().splitlines()
+    return _parse_lines(lines, 0)
+
+def iter_task_chunks(dataset_path: str, chunk_lines: int = DEFAULT_CHUNK_LINES):
+    """
+    Membaca dataset per-chunk agar memori tetap kecil untuk file yang sangat besar.
+    Setiap chunk adalah TaskStore dengan id global (nomor baris pada file).
+    """
+    if not os.path.exists(dataset_path):
+        raise FileNotFoundError(f"File dataset '{dataset_path}' tidak ditemukan.")
+
+    line_no = 0
+    buffer = []
+    with open(dataset_path, 'rb') as f:
+        for line in _iter_lines(f):
+            buffer.append(line)
+            if len(buffer) >= chunk_lines:
+                yield _parse_lines(buffer, line_no)
+                line_no += len(buffer)
+                buffer = []
+    if buffer:
+        yield _parse_lines(buffer, line_no)
+
+# --- Format Biner (Memory-Mapped) ---
+
+def save_task_store(store: TaskStore, path: str):
+    """Menyimpan TaskStore ke file .npy berisi record (id, index, cpu_load)."""
+    records = np.empty(len(store), dtype=TASK_RECORD_DTYPE)
+    records['id'] = store.ids
+    records['index'] = store.indices
+    records['cpu_load'] = store.cpu_loads
+    np.save(path, records)
+
+def load_task_store_binary(path: str, mmap: bool = True) -> TaskStore:
+    """Memuat TaskStore dari file .npy; default di-memory-map (tanpa salin ke RAM)."""
+    records = np.load(path, mmap_mode='r' if mmap else None)
+    if records.dtype != TASK_RECORD_DTYPE:
+        raise ValueError(f"Format biner '{path}' tidak dikenali: {records.dtype}")
+    return TaskStore(records['id'], records['index'], records['cpu_load'])
+
+def convert_to_binary(dataset_path: str, output_path: str, chunk_lines: int = DEFAULT_CHUNK_LINES) -> TaskStore:
+    """Mengonversi dataset teks ke format .npy (dibaca per-chunk agar hemat memori)."""
+    chunks = list(iter_task_chunks(dataset_path, chunk_lines))
+    rejected_counts = {}
+    for chunk in chunks:
+        for reason, count in chunk.rejected_counts.items():
+            rejected_counts[reason] = rejected_counts.get(reason, 0) + count
+    store = TaskStore(
+        ids=np.concatenate([c.ids for c in chunks]) if chunks else np.empty(0, dtype=np.int64),
+        indices=np.concatenate([c.indices for c in chunks]) if chunks else np.empty(0, dtype=np.int64),
+        cpu_loads=np.concatenate([c.cpu_loads for c in chunks]) if chunks else np.empty(0, dtype=np.int64),
+        rejected=[r for c in chunks for r in c.rejected][:MAX_REJECTED_SAMPLES],
+        rejected_counts=rejected_counts,
+    )
+    save_task_store(store, output_path)
+    return store
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Konversi dataset teks ke format biner .npy (memory-mapped).")
+    parser.add_argument('dataset', help="File dataset teks (satu indeks tugas per baris).")
+    parser.add_argument('output', nargs='?', help="File .npy tujuan (default: <dataset>.npy).")
+    parser.add_argument('--chunk-lines', type=int, default=DEFAULT_CHUNK_LINES)
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.splitext(args.dataset)[0] + '.npy'
+    try:
+        store = convert_to_binary(args.dataset, output, args.chunk_lines)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{len(store)} tugas disimpan ke '{output}'.")
+    if store.rejected_counts:
+        print(f"Baris ditolak: {store.rejected_counts}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()